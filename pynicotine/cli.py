@@ -70,17 +70,17 @@ class CLIInputProcessor(Thread):
 
     def _handle_prompt_command(self, user_input):
 
+        user_input = user_input.strip()
+
         if not user_input:
             return False
 
         command, *args = user_input.split(maxsplit=1)
+        args = args[0] if args else ""
 
         if command.startswith("/"):
             command = command[1:]
 
-        if args:
-            (args,) = args
-
         events.emit_main_thread("cli-command", command, args)
         return True
 
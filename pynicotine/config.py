@@ -43,6 +43,8 @@ class Config:
     need_config() - returns true if configuration information is incomplete
     read_config() - reads configuration information from file
     write_configuration - writes configuration information to file
+    schedule_write_configuration - writes configuration information to file
+    after a short delay, coalescing multiple writes into one
 
     The actual configuration information is stored as a two-level dictionary.
     First-level keys are config sections, second-level keys are config
@@ -60,6 +62,7 @@ class Config:
         self.defaults = {}
         self.removed_options = {}
         self._parser = None
+        self._write_timer_id = None
 
     @staticmethod
     def get_user_folders():
@@ -746,8 +749,24 @@ class Config:
     def _write_config_callback(self, file_path):
         self._parser.write(file_path)
 
+    def _write_scheduled_configuration(self):
+        self._write_timer_id = None
+        self.write_configuration()
+
+    def schedule_write_configuration(self, delay=5):
+
+        if self._write_timer_id is not None:
+            # Write already pending
+            return
+
+        self._write_timer_id = events.schedule(delay=delay, callback=self._write_scheduled_configuration)
+
     def write_configuration(self):
 
+        if self._write_timer_id is not None:
+            events.cancel_scheduled(self._write_timer_id)
+            self._write_timer_id = None
+
         if not self.config_loaded:
             return
 
@@ -813,6 +832,10 @@ class Config:
         self.defaults.clear()
         self.removed_options.clear()
 
+        if self._write_timer_id is not None:
+            events.cancel_scheduled(self._write_timer_id)
+            self._write_timer_id = None
+
         self.config_loaded = False
 
 
@@ -17,6 +17,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import signal
 import sys
 import threading
 
@@ -181,8 +182,6 @@ class Core:
     def _init_signal_handler(self):
         """Handle Ctrl+C and "kill" exit gracefully."""
 
-        import signal
-
         for signal_type in (signal.SIGINT, signal.SIGTERM):
             signal.signal(signal_type, self.quit)
 
@@ -230,7 +229,6 @@ class Core:
     def quit(self, signal_type=None, _frame=None, should_finish_uploads=False):
 
         if not should_finish_uploads:
-            import signal
             log.add(_("Quitting %(program)s %(version)s, %(status)s…"), {
                 "program": pynicotine.__application_name__,
                 "version": pynicotine.__version__,
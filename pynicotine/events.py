@@ -19,6 +19,7 @@
 import time
 
 from collections import deque
+from threading import Event
 from threading import Thread
 
 
@@ -202,6 +203,7 @@ class Events:
         self._callbacks = {}
         self._thread_events = deque()
         self._pending_scheduler_events = deque()
+        self._scheduler_wakeup = Event()
         self._scheduler_events = {}
         self._scheduler_event_id = 0
         self._is_active = False
@@ -236,10 +238,10 @@ class Events:
 
     def emit(self, event_name, *args, **kwargs):
 
-        if event_name not in self._callbacks:
-            return
+        callbacks = self._callbacks.get(event_name)
 
-        callbacks = self._callbacks[event_name]
+        if callbacks is None:
+            return
 
         if event_name == "quit":
             # Event and log modules register callbacks first, but need to quit last
@@ -264,11 +266,13 @@ class Events:
 
         self._pending_scheduler_events.append(
             (self._scheduler_event_id, (next_time, delay, repeat, callback, callback_args)))
+        self._scheduler_wakeup.set()
 
         return self._scheduler_event_id
 
     def cancel_scheduled(self, event_id):
         self._pending_scheduler_events.append((event_id, None))
+        self._scheduler_wakeup.set()
 
     def process_thread_events(self):
         """Called by the main loop 10 times per second to emit thread events in
@@ -284,10 +288,8 @@ class Events:
 
             return True
 
-        event_list = []
-
-        while self._thread_events:
-            event_list.append(self._thread_events.popleft())
+        popleft = self._thread_events.popleft
+        event_list = [popleft() for _ in range(len(self._thread_events))]
 
         for event_name, args, kwargs in event_list:
             self.emit(event_name, *args, **kwargs)
@@ -297,6 +299,10 @@ class Events:
     def _run_scheduler(self):
 
         while self._is_active:
+            # Clear before processing pending events, in order to not miss
+            # wakeups for events added while we're busy
+            self._scheduler_wakeup.clear()
+
             # Scheduled events additions/removals from other threads
             while self._pending_scheduler_events:
                 event_id, event = self._pending_scheduler_events.popleft()
@@ -308,7 +314,7 @@ class Events:
 
             # No scheduled events
             if not self._scheduler_events:
-                time.sleep(self.SCHEDULER_MAX_IDLE)
+                self._scheduler_wakeup.wait(self.SCHEDULER_MAX_IDLE)
                 continue
 
             # Retrieve upcoming event
@@ -327,7 +333,7 @@ class Events:
 
                 continue
 
-            time.sleep(min(sleep_time, self.SCHEDULER_MAX_IDLE))
+            self._scheduler_wakeup.wait(min(sleep_time, self.SCHEDULER_MAX_IDLE))
 
     def _thread_callback(self, callback, *args, **kwargs):
         callback(*args, **kwargs)
@@ -341,6 +347,7 @@ class Events:
         self._callbacks.clear()
         self._pending_scheduler_events.clear()
         self._scheduler_events.clear()
+        self._scheduler_wakeup.set()
 
 
 events = Events()
@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from gi.repository import GLib
 from gi.repository import Gtk
 
 import pynicotine
@@ -39,6 +40,8 @@ class FastConfigure(Dialog):
 
         self.rescan_required = False
         self.finished = False
+        self._completeness_state = None
+        self._completeness_idle_id = None
 
         (
             self.account_page,
@@ -59,6 +62,7 @@ class FastConfigure(Dialog):
         ) = ui.load(scope=self, path="dialogs/fastconfigure.ui")
 
         self.pages = [self.welcome_page, self.account_page, self.port_page, self.share_page, self.summary_page]
+        self._page_index = 0
 
         super().__init__(
             parent=application.window,
@@ -109,6 +113,9 @@ class FastConfigure(Dialog):
 
     def destroy(self):
 
+        if self._completeness_idle_id is not None:
+            GLib.source_remove(self._completeness_idle_id)
+
         self.download_folder_button.destroy()
         self.shares_list_view.destroy()
 
@@ -118,12 +125,19 @@ class FastConfigure(Dialog):
         """Turns on the complete flag if everything required is filled in."""
 
         page = self.stack.get_visible_child()
-        page_complete = (
+        page_complete = bool(
             (page in (self.welcome_page, self.port_page, self.summary_page))
             or (page == self.account_page and self.username_entry.get_text() and self.password_entry.get_text())
             or (page == self.share_page and self.download_folder_button.get_path())
         )
         self.finished = (page == self.summary_page)
+        completeness_state = (page, page_complete)
+
+        if completeness_state == self._completeness_state:
+            # Nothing changed, e.g. when typing in an already filled entry
+            return
+
+        self._completeness_state = completeness_state
         next_label = _("_Finish") if page == self.summary_page else _("_Next")
 
         if self.next_button.get_label() != next_label:
@@ -134,9 +148,18 @@ class FastConfigure(Dialog):
         for button in (self.previous_button, self.next_button):
             button.set_visible(page != self.welcome_page)
 
-    def on_entry_changed(self, *_args):
+    def _reset_completeness_idle(self):
+        self._completeness_idle_id = None
         self.reset_completeness()
 
+    def on_entry_changed(self, *_args):
+
+        if self._completeness_idle_id is not None:
+            return
+
+        # Coalesce checks for consecutive keystrokes
+        self._completeness_idle_id = GLib.idle_add(self._reset_completeness_idle)
+
     def on_user_entry_activate(self, *_args):
 
         if not self.username_entry.get_text():
@@ -233,20 +256,22 @@ class FastConfigure(Dialog):
             self.close()
             return
 
-        start_page_index = self.pages.index(self.stack.get_visible_child()) + 1
+        start_page_index = self._page_index + 1
 
-        for page in self.pages[start_page_index:]:
+        for page_index, page in enumerate(self.pages[start_page_index:], start=start_page_index):
             if page.get_visible():
+                self._page_index = page_index
                 self.next_button.grab_focus()
                 self.stack.set_visible_child(page)
                 return
 
     def on_previous(self, *_args):
 
-        start_page_index = self.pages.index(self.stack.get_visible_child())
+        for page_index in reversed(range(self._page_index)):
+            page = self.pages[page_index]
 
-        for page in reversed(self.pages[:start_page_index]):
             if page.get_visible():
+                self._page_index = page_index
                 self.previous_button.grab_focus()
                 self.stack.set_visible_child(page)
                 return
@@ -276,6 +301,7 @@ class FastConfigure(Dialog):
     def on_show(self, *_args):
 
         self.rescan_required = False
+        self._page_index = 0
         self.stack.set_visible_child(self.welcome_page)
 
         # welcome_page
@@ -294,7 +320,10 @@ class FastConfigure(Dialog):
         # share_page
         self.download_folder_button.set_path(core.downloads.get_default_download_folder())
 
+        self.shares_list_view.freeze()
         self.shares_list_view.clear()
 
         for virtual_name, folder_path, *_unused in config.sections["transfers"]["shared"]:
             self.shares_list_view.add_row([virtual_name, folder_path], select_row=False)
+
+        self.shares_list_view.unfreeze()
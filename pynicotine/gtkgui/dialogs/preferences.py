@@ -629,6 +629,7 @@ class SharesPage:
 
     def set_settings(self):
 
+        self.shares_list_view.freeze()
         self.shares_list_view.clear()
 
         self.application.preferences.set_widgets_data(self.options)
@@ -649,6 +650,8 @@ class SharesPage:
             self.shares_list_view.add_row(
                 [virtual_name, folder_path, _("Trusted")], select_row=False)
 
+        self.shares_list_view.unfreeze()
+
         self.rescan_required = self.recompress_shares_required = False
 
     def get_settings(self):
@@ -73,6 +73,7 @@ class TreeView:
         self._persistent_sort = persistent_sort
         self._columns_changed_handler = None
         self._last_redraw_time = 0
+        self._is_frozen = False
         self._selection = self.widget.get_selection()
         self._h_adjustment = parent.get_hadjustment()
         self._v_adjustment = parent.get_vadjustment()
@@ -476,25 +477,44 @@ class TreeView:
         if self._sort_column is not None and self._sort_type is not None:
             self.model.set_sort_column_id(self._sort_column, self._sort_type)
 
+    def freeze(self):
+        """Detaches the model from the view and disables sorting while adding
+        many rows at once, to avoid redundant view updates."""
+
+        self._is_frozen = True
+        self.disable_sorting()
+        self.widget.set_model(None)
+
+    def unfreeze(self):
+        """Restores sorting and reattaches the model to the view after rows
+        have been added."""
+
+        self._is_frozen = False
+        self.enable_sorting()
+        self.widget.set_model(self.model)
+
     def set_show_expanders(self, show):
         self.widget.set_show_expanders(show)
 
     def add_row(self, values, select_row=True, prepend=False, parent_iterator=None):
 
         position = 0 if prepend else -1
-        values = values[:]
         key = values[self._iterator_key_column]
 
         if key in self.iterators:
             return None
 
-        for i, gvalue in self._column_gvalues.items():
-            value = values[i]
+        if self._column_gvalues:
+            # Copy values before replacing any of them, the list belongs to the caller
+            values = values[:]
+
+            for i, gvalue in self._column_gvalues.items():
+                value = values[i]
 
-            if value > 2147483647:
-                # Need gvalue conversion for large integers
-                gvalue.set_value(value)
-                values[i] = gvalue
+                if value > 2147483647:
+                    # Need gvalue conversion for large integers
+                    gvalue.set_value(value)
+                    values[i] = gvalue
 
         if self.has_tree:
             self.iterators[key] = iterator = self.model.insert_with_values(  # pylint: disable=no-member
@@ -622,13 +642,16 @@ class TreeView:
 
     def clear(self):
 
-        self.widget.set_model(None)
+        # A frozen model is already detached, and is reattached by unfreeze()
+        if not self._is_frozen:
+            self.widget.set_model(None)
 
         self.model.clear()
         self.iterators.clear()
         self._iterator_keys.clear()
 
-        self.widget.set_model(self.model)
+        if not self._is_frozen:
+            self.widget.set_model(self.model)
 
     @staticmethod
     def get_icon_label(column, icon_name, is_short_country_label=False):
@@ -99,6 +99,9 @@ class Logger:
         for level in config.sections["logging"]["debugmodes"]:
             self._log_levels.add(level)
 
+    def has_log_level(self, log_level):
+        return log_level in self._log_levels
+
     def add_log_level(self, log_level, is_permanent=True):
 
         self._log_levels.add(log_level)
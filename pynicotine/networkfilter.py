@@ -17,6 +17,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from bisect import bisect_left
+from functools import lru_cache
 from socket import inet_aton
 from struct import Struct
 
@@ -409,7 +410,14 @@ class NetworkFilter:
 
         return None
 
-    def get_country_code(self, ip_address):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def get_country_code(ip_address):
+        """Returns the country code of an IP address.
+
+        Results are cached, since the same addresses are looked up
+        repeatedly.
+        """
 
         ip_num, = UINT32_UNPACK(inet_aton(ip_address))
         ip_index = bisect_left(ip_ranges.values, ip_num)
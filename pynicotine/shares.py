@@ -29,6 +29,7 @@ import time
 
 from collections import defaultdict
 from collections import deque
+from itertools import chain
 from os import SEEK_END
 from os import SEEK_SET
 from pickle import HIGHEST_PROTOCOL
@@ -881,8 +882,7 @@ class Shares:
     def get_normalized_virtual_name(self, virtual_name, shared_folders=None):
 
         if shared_folders is None:
-            public_shares, buddy_shares, trusted_shares = self.get_shared_folders()
-            shared_folders = (public_shares + buddy_shares + trusted_shares)
+            shared_folders = chain(*self.get_shared_folders())
 
         # Provide a default name for root folders
         if not virtual_name:
@@ -893,8 +893,10 @@ class Shares:
         new_virtual_name = str(virtual_name)
 
         # Check if virtual share name is already in use
+        used_virtual_names = {x[0] for x in shared_folders}
         counter = 1
-        while new_virtual_name in (x[0] for x in shared_folders):
+
+        while new_virtual_name in used_virtual_names:
             new_virtual_name = f"{virtual_name}{counter}"
             counter += 1
 
@@ -915,7 +917,7 @@ class Shares:
         public_shares, buddy_shares, trusted_shares = share_groups
         virtual_name = core.shares.get_normalized_virtual_name(
             virtual_name or os.path.basename(folder_path),
-            shared_folders=(public_shares + buddy_shares + trusted_shares)
+            shared_folders=chain(public_shares, buddy_shares, trusted_shares)
         )
         permission_level_shares = {
             PermissionLevel.PUBLIC: public_shares,
@@ -31,6 +31,7 @@ from threading import Thread
 
 from pynicotine.events import events
 from pynicotine.logfacility import log
+from pynicotine.logfacility import LogLevel
 from pynicotine.slskmessages import DISTRIBUTED_MESSAGE_CLASSES
 from pynicotine.slskmessages import DISTRIBUTED_MESSAGE_CODES
 from pynicotine.slskmessages import NETWORK_MESSAGE_EVENTS
@@ -677,11 +678,10 @@ class NetworkThread(Thread):
         if msg is None:
             return
 
-        msg_class = msg.__class__
         log.add_msg_contents(msg)
+        event_name = NETWORK_MESSAGE_EVENTS.get(msg.__class__)
 
-        if msg_class in NETWORK_MESSAGE_EVENTS:
-            event_name = NETWORK_MESSAGE_EVENTS[msg_class]
+        if event_name is not None:
             events.emit_main_thread(event_name, msg)
 
     def _modify_connection_events(self, conn_obj, selector_events):
@@ -1464,7 +1464,7 @@ class NetworkThread(Thread):
 
         conn_obj = self._conns[self._server_socket]
         conn_obj.obuf.extend(msg_obj.pack_uint32(len(msg) + 4))
-        conn_obj.obuf.extend(msg_obj.pack_uint32(SERVER_MESSAGE_CODES[msg_obj.__class__]))
+        conn_obj.obuf.extend(msg_obj.pack_uint32(SERVER_MESSAGE_CODES[msg_class]))
         conn_obj.obuf.extend(msg)
 
         self._modify_connection_events(conn_obj, selectors.EVENT_READ | selectors.EVENT_WRITE)
@@ -1792,7 +1792,9 @@ class NetworkThread(Thread):
 
                 self._emit_network_message_event(msg)
 
-            else:
+            elif log.has_log_level(LogLevel.MISCELLANEOUS):
+                # Peers can send many unknown messages without being disconnected,
+                # avoid copying message contents unless they will be logged
                 host, port = conn_obj.addr
                 log.add_debug(("Peer message type %(type)s size %(size)i contents %(msg_buffer)s unknown, "
                                "from user: %(user)s, %(host)s:%(port)s"), {
@@ -2530,10 +2532,10 @@ class NetworkThread(Thread):
 
     def _process_outgoing_messages(self, msgs):
 
-        for msg_obj in msgs:
-            if not self._should_process_queue:
-                return
+        if not self._should_process_queue:
+            return
 
+        for msg_obj in msgs:
             msg_type = msg_obj.msg_type
 
             if msg_type == MessageType.INIT:
@@ -2579,15 +2581,21 @@ class NetworkThread(Thread):
 
             process_func(msg_obj)
 
+            if msg_type == MessageType.INTERNAL and not self._should_process_queue:
+                # Only internal messages can disconnect us from the server,
+                # discard remaining messages in that case
+                return
+
     def _process_queue_messages(self):
 
-        if not self._message_queue:
-            return
+        message_queue = self._message_queue
 
-        msgs = []
+        if not message_queue:
+            return
 
-        while self._message_queue:
-            msgs.append(self._message_queue.popleft())
+        # Only drain messages present now, other threads may keep appending
+        popleft = message_queue.popleft
+        msgs = [popleft() for _ in range(len(message_queue))]
 
         self._process_outgoing_messages(msgs)
 
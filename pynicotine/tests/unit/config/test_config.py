@@ -20,9 +20,11 @@ import os
 import shutil
 
 from unittest import TestCase
+from unittest.mock import patch
 
 from pynicotine.config import config
 from pynicotine.core import core
+from pynicotine.events import events
 from pynicotine.utils import encode_path
 
 CURRENT_FOLDER_PATH = os.path.dirname(os.path.realpath(__file__))
@@ -82,3 +84,45 @@ class ConfigTest(TestCase):
         # Reset
         config.sections["server"]["login"] = "user123"
         config.write_configuration()
+
+    def test_schedule_write_config(self):
+        """Test coalescing of scheduled config writes."""
+
+        with patch.object(events, "schedule", return_value=1) as mock_schedule, \
+             patch.object(events, "cancel_scheduled") as mock_cancel_scheduled:
+
+            # Verify that only one write is scheduled at a time
+            config.schedule_write_configuration()
+            config.schedule_write_configuration()
+
+            mock_schedule.assert_called_once()
+            self.assertEqual(config._write_timer_id, 1)  # pylint: disable=protected-access
+
+            # Verify that an immediate write cancels the pending one
+            config.write_configuration()
+
+            mock_cancel_scheduled.assert_called_once_with(1)
+            self.assertIsNone(config._write_timer_id)    # pylint: disable=protected-access
+
+            # Verify that the scheduled callback writes the config once
+            mock_schedule.reset_mock()
+            mock_cancel_scheduled.reset_mock()
+
+            config.schedule_write_configuration()
+            config.sections["server"]["login"] = "newname"
+            _args, kwargs = mock_schedule.call_args
+            write_callback = kwargs["callback"]
+
+            with patch.object(config, "write_configuration", wraps=config.write_configuration) as mock_write:
+                write_callback()
+
+            mock_write.assert_called_once()
+            mock_cancel_scheduled.assert_not_called()
+            self.assertIsNone(config._write_timer_id)    # pylint: disable=protected-access
+
+        with open(encode_path(config.config_file_path), encoding="utf-8") as file_handle:
+            self.assertIn("newname", file_handle.read())
+
+        # Reset
+        config.sections["server"]["login"] = "user123"
+        config.write_configuration()
@@ -212,3 +212,24 @@ class SharesTest(TestCase):
         self.assertNotIn(os.path.join(TRUSTED_SHARES_FOLDER_PATH, ".hidden_folder", "nothing"), trusted_files)
         self.assertIn(os.path.join(TRUSTED_SHARES_FOLDER_PATH, "dummy_file3"), trusted_files)
         self.assertEqual(len(trusted_files), 3)
+
+    def test_normalized_virtual_name(self):
+        """Test that unique virtual names are generated for new shares."""
+
+        shared_folders = [
+            ("Music", "/home/user/Music"),
+            ("Music1", "/media/Music"),
+            ("Downloads", "/home/user/Downloads")
+        ]
+
+        self.assertEqual(core.shares.get_normalized_virtual_name("Music", shared_folders), "Music2")
+        self.assertEqual(core.shares.get_normalized_virtual_name("Downloads", shared_folders), "Downloads1")
+        self.assertEqual(core.shares.get_normalized_virtual_name("Videos", shared_folders), "Videos")
+        self.assertEqual(core.shares.get_normalized_virtual_name("a/b\\c", shared_folders), "a_b_c")
+        self.assertEqual(core.shares.get_normalized_virtual_name("", shared_folders), "Shared")
+
+        # Lowest free suffix is reused after a share is removed
+        shared_folders.append(("Music2", "/media/Music2"))
+        shared_folders.remove(("Music1", "/media/Music"))
+
+        self.assertEqual(core.shares.get_normalized_virtual_name("Music", shared_folders), "Music1")
@@ -0,0 +1,47 @@
+# COPYRIGHT (C) 2024 Nicotine+ Contributors
+#
+# GNU GENERAL PUBLIC LICENSE
+#    Version 3, 29 June 2007
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from pynicotine.cli import CLIInputProcessor
+from pynicotine.events import events
+
+
+class CLITest(TestCase):
+
+    def setUp(self):
+        self.handle_prompt_command = CLIInputProcessor()._handle_prompt_command  # pylint: disable=protected-access
+
+    def test_blank_prompt_command(self):
+
+        with patch.object(events, "emit_main_thread") as mock_emit:
+            self.assertFalse(self.handle_prompt_command(""))
+            self.assertFalse(self.handle_prompt_command(" \t "))
+
+        mock_emit.assert_not_called()
+
+    def test_prompt_command_whitespace(self):
+
+        with patch.object(events, "emit_main_thread") as mock_emit:
+            self.assertTrue(self.handle_prompt_command("/msg\tbob hi"))
+            mock_emit.assert_called_once_with("cli-command", "msg", "bob hi")
+
+            mock_emit.reset_mock()
+            self.assertTrue(self.handle_prompt_command("  /quit  "))
+            mock_emit.assert_called_once_with("cli-command", "quit", "")
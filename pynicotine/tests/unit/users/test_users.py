@@ -0,0 +1,100 @@
+# COPYRIGHT (C) 2024 Nicotine+ Contributors
+#
+# GNU GENERAL PUBLIC LICENSE
+#    Version 3, 29 June 2007
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import time
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from pynicotine import slskmessages
+from pynicotine.config import config
+from pynicotine.core import core
+
+DATA_FOLDER_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "temp_data")
+
+
+class UsersTest(TestCase):
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+
+        config.data_folder_path = DATA_FOLDER_PATH
+        config.config_file_path = os.path.join(DATA_FOLDER_PATH, "temp_config")
+
+        core.init_components(enabled_components={"pluginhandler", "network_filter", "users"})
+
+    def tearDown(self):
+
+        core.quit()
+
+        self.assertIsNone(core.pluginhandler)
+        self.assertIsNone(core.network_filter)
+        self.assertIsNone(core.users)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(DATA_FOLDER_PATH)
+
+    def test_remove_stale_ip_requests(self):
+        """Verify that unanswered IP address requests expire, while recent
+        ones are kept."""
+
+        current_time = time.monotonic()
+        core.users._ip_requested = {
+            "stale_user": (False, current_time - core.users.IP_REQUEST_TIMEOUT),
+            "fresh_user": (True, current_time)
+        }
+
+        core.users._remove_stale_ip_requests()
+
+        self.assertNotIn("stale_user", core.users._ip_requested)
+        self.assertEqual(core.users._ip_requested["fresh_user"], (True, current_time))
+
+        with patch.object(core, "send_message_to_server") as mock_send_message:
+            core.users.request_ip_address("stale_user")
+            core.users.request_ip_address("fresh_user")
+
+        mock_send_message.assert_called_once()
+        message, = mock_send_message.call_args[0]
+
+        self.assertIsInstance(message, slskmessages.GetPeerAddress)
+        self.assertEqual(message.user, "stale_user")
+        self.assertIn("stale_user", core.users._ip_requested)
+
+    def test_get_peer_address_notify(self):
+        """Verify that the notify flag of an IP address request is respected
+        when the server responds."""
+
+        with patch.object(core, "send_message_to_server"):
+            core.users.request_ip_address("quiet_user")
+            core.users.request_ip_address("notify_user", notify=True)
+
+        for username, notify in (("quiet_user", False), ("notify_user", True)):
+            msg = slskmessages.GetPeerAddress(username)
+            msg.ip_address = "1.2.3.4"
+            msg.port = 2234
+
+            with patch.object(core.pluginhandler, "user_resolve_notification") as mock_notification:
+                core.users._get_peer_address(msg)
+
+            args, _kwargs = mock_notification.call_args
+            self.assertEqual(len(args), 4 if notify else 3)
+            self.assertNotIn(username, core.users._ip_requested)
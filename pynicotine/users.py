@@ -16,6 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import time
+
+from urllib.parse import quote
+
 import pynicotine
 from pynicotine import slskmessages
 from pynicotine.config import config
@@ -40,6 +44,8 @@ class WatchedUser:
 
 class Users:
 
+    IP_REQUEST_TIMEOUT = 300
+
     def __init__(self):
 
         self.login_status = slskmessages.UserStatus.OFFLINE
@@ -55,6 +61,7 @@ class Users:
         self.watched = {}
         self.privileged = set()
         self._ip_requested = {}
+        self._ip_requests_timer_id = None
         self._pending_watch_removals = set()
 
         for event_name, callback in (
@@ -86,9 +93,7 @@ class Users:
 
     def open_privileges_url(self):
 
-        import urllib.parse
-
-        login = urllib.parse.quote(self.login_username)
+        login = quote(self.login_username)
         open_uri(pynicotine.__privileges_url__ % login)
 
     def request_change_password(self, password):
@@ -107,7 +112,7 @@ class Users:
         if username in self._ip_requested:
             return
 
-        self._ip_requested[username] = notify
+        self._ip_requested[username] = (notify, time.monotonic())
         core.send_message_to_server(slskmessages.GetPeerAddress(username))
 
     def request_set_status(self, status):
@@ -131,9 +136,20 @@ class Users:
 
         self.watched[username] = WatchedUser(username)
 
+    def _remove_stale_ip_requests(self):
+        """Allows IP addresses to be requested again, in case the server never
+        responded to previous requests."""
+
+        current_time = time.monotonic()
+
+        for username, (_notify, request_time) in self._ip_requested.copy().items():
+            if (current_time - request_time) >= self.IP_REQUEST_TIMEOUT:
+                del self._ip_requested[username]
+
     def _server_disconnect(self, manual_disconnect=False):
 
         self.login_status = slskmessages.UserStatus.OFFLINE
+        events.cancel_scheduled(self._ip_requests_timer_id)
 
         if core.pluginhandler:
             core.pluginhandler.server_disconnect_notification(manual_disconnect)
@@ -162,6 +178,10 @@ class Users:
             _local_ip_address, self.public_port = msg.local_address
             self.addresses[username] = msg.local_address
 
+            # Check for unanswered IP address requests every minute
+            self._ip_requests_timer_id = events.schedule(
+                delay=60, callback=self._remove_stale_ip_requests, repeat=True)
+
             core.send_message_to_server(slskmessages.CheckPrivileges())
             self.set_away_mode(config.sections["server"]["away"])
             self.watch_user(username)
@@ -187,7 +207,7 @@ class Users:
         """Server code 3."""
 
         username = msg.user
-        notify = self._ip_requested.pop(username, None)
+        notify, _request_time = self._ip_requested.pop(username, (False, None))
         ip_address = msg.ip_address
         user_offline = (ip_address == "0.0.0.0")
         country_code = core.network_filter.get_country_code(ip_address)
@@ -274,6 +294,7 @@ class Users:
             return
 
         is_watched = (username in self.watched)
+        previous_status = self.statuses.get(username)
 
         # User went offline, reset stored IP address and country
         if status == slskmessages.UserStatus.OFFLINE:
@@ -285,21 +306,19 @@ class Users:
                 self.watched.pop(username, None)
 
         elif is_watched:
-            user_status = self.statuses.get(username)
-
             # Online user seen for the first time, request IP address and country
-            if user_status is None:
+            if previous_status is None:
                 self.request_ip_address(username)
 
             # Previously watched user logged in again. Server will not send user stats, so request them.
-            elif user_status == slskmessages.UserStatus.OFFLINE:
+            elif previous_status == slskmessages.UserStatus.OFFLINE:
                 self.request_user_stats(username)
                 self.request_ip_address(username)
 
         self._pending_watch_removals.discard(username)
 
         # Store statuses for watched users, update statuses of room members
-        if is_watched or username in self.statuses:
+        if is_watched or previous_status is not None:
             self.statuses[username] = status
 
         core.pluginhandler.user_status_notification(username, status, msg.privileged)
@@ -385,6 +404,6 @@ class Users:
         """Server code 142."""
 
         config.sections["server"]["passw"] = msg.password
-        config.write_configuration()
+        config.schedule_write_configuration()
 
         log.add(_("Your password has been changed"), title=_("Password Changed"))